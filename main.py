@@ -8,6 +8,7 @@ from telegram.ext import (
     Filters,
     CallbackContext,
     ConversationHandler,
+    TypeHandler,
 )
 from telethon import TelegramClient, events
 from telethon.sessions import StringSession
@@ -15,8 +16,18 @@ from telethon.tl.types import InputPeerChannel, InputPeerUser
 import asyncio
 import re
 import sqlite3
-from threading import Thread
-from datetime import datetime
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from threading import Thread, RLock
+from datetime import datetime, timezone
 import pytz
 import os
 from dotenv import load_dotenv
@@ -48,6 +59,19 @@ logger = logging.getLogger(__name__)
     MESSAGE_TEXT,
 ) = range(9)
 
+# Ограничения для состояния в памяти (время жизни в секундах)
+CONVERSATION_TIMEOUT = 30 * 60
+CONVERSATION_MAX_ENTRIES = 10000
+USER_DATA_TTL = 24 * 60 * 60
+USER_DATA_MAX_ENTRIES = 10000
+CHAT_DATA_TTL = 24 * 60 * 60
+CHAT_DATA_MAX_ENTRIES = 10000
+VERIFICATION_CODE_TTL = 10 * 60
+VERIFICATION_CODE_MAX_ENTRIES = 10000
+ACTIVE_CLIENT_TTL = 24 * 60 * 60
+ACTIVE_CLIENT_MAX_ENTRIES = 1000
+STATE_PURGE_INTERVAL = 10 * 60
+
 # Инициализация базы данных
 def init_db():
     conn = sqlite3.connect('bot_data.db')
@@ -113,11 +137,19 @@ def init_db():
     )
     ''')
     
+    # Индексы для выгрузки по пользователю и периоду
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_user_created ON logs (user_id, created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_created ON logs (created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_action_created ON logs (action, created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_user_created ON messages (user_id, created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_created ON messages (created_at)")
+    
+    # WAL позволяет читать базу (выгрузка) не блокируя запись бота
+    cursor.execute("PRAGMA journal_mode=WAL")
+    
     conn.commit()
     conn.close()
 
-init_db()
-
 class DatabaseManager:
     @staticmethod
     def log_action(user_id, action, details=""):
@@ -199,10 +231,312 @@ class DatabaseManager:
         conn.close()
         return message[0] if message else None
 
+# Выгружаемые наборы данных: (таблица, колонки, дополнительное условие)
+EXPORT_DATASETS = {
+    'logs': ('logs', ('id', 'user_id', 'action', 'details', 'created_at'), None),
+    'messages': ('messages', ('id', 'user_id', 'message_text', 'is_active', 'created_at'), None),
+    'deliveries': (
+        'logs',
+        ('id', 'user_id', 'action', 'details', 'created_at'),
+        "action IN ('message_sent', 'send_error')",
+    ),
+}
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_BATCH_SIZE = 1000
+# Ограничение Bot API на размер файла, отправляемого ботом
+EXPORT_MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+
+class DataExporter:
+    """Потоковая выгрузка логов, сообщений и истории рассылок в gzip"""
+
+    @staticmethod
+    def connect_readonly():
+        # Только чтение: выгрузка не может ничего изменить или заблокировать запись
+        return sqlite3.connect('file:bot_data.db?mode=ro', uri=True)
+
+    @staticmethod
+    def normalize_time(value):
+        # created_at хранится как 'YYYY-MM-DD HH:MM:SS' (UTC), сравниваем строки
+        if value is None:
+            return None
+        moment = datetime.fromisoformat(value)
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc)
+        return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def build_query(dataset, user_id=None, since=None, until=None):
+        table, columns, condition = EXPORT_DATASETS[dataset]
+        conditions = [condition] if condition else []
+        params = []
+        
+        # Условия и сортировка соответствуют индексам (user_id, created_at) и (created_at)
+        if user_id is not None:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(DataExporter.normalize_time(since))
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(DataExporter.normalize_time(until))
+        
+        query = f"SELECT {', '.join(columns)} FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at, id"
+        return query, params, columns
+
+    @staticmethod
+    def iter_rows(cursor, batch_size=EXPORT_BATCH_SIZE):
+        # Строки читаются порциями, в памяти не больше batch_size записей
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    @staticmethod
+    def iter_csv(rows, columns):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+
+    @staticmethod
+    def iter_jsonl(rows, columns):
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def export(dataset, output, fmt='csv', user_id=None, since=None, until=None,
+               batch_size=EXPORT_BATCH_SIZE):
+        """Выгружает набор данных в сжатый файл, возвращает число строк"""
+        if dataset not in EXPORT_DATASETS:
+            raise ValueError(f"Неизвестный набор данных: {dataset}")
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Неизвестный формат: {fmt}")
+        
+        query, params, columns = DataExporter.build_query(dataset, user_id, since, until)
+        
+        count = 0
+        def counted(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+        
+        # Пишем во временный файл рядом с итоговым, чтобы при ошибке не оставить обрезанный архив
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.export_', suffix='.tmp', dir=os.path.dirname(os.path.abspath(output))
+        )
+        os.close(fd)
+        
+        conn = None
+        try:
+            conn = DataExporter.connect_readonly()
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = counted(DataExporter.iter_rows(cursor, batch_size))
+            lines = DataExporter.iter_csv(rows, columns) if fmt == 'csv' else DataExporter.iter_jsonl(rows, columns)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', newline='') as f:
+                for line in lines:
+                    f.write(line)
+            os.replace(tmp_path, output)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+        
+        return count
+
+# Все хранилища состояния по имени, для статистики и очистки
+state_stores = {}
+
+class ExpiringStore(MutableMapping):
+    """Словарь с временем жизни записей и ограничением размера (вытеснение LRU)
+
+    При sliding=True чтение продлевает жизнь записи, иначе срок отсчитывается
+    от последней записи значения.
+    """
+
+    def __init__(self, name, ttl, max_entries, default_factory=None, on_evict=None, sliding=True):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.default_factory = default_factory
+        self.on_evict = on_evict
+        self.sliding = sliding
+        self.evictions = 0
+        self.expirations = 0
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = RLock()
+        state_stores[name] = self
+
+    def _evict(self, key, value):
+        # Освобождение ресурсов записи, вытесненной по размеру или времени жизни
+        if self.on_evict is None:
+            return
+        try:
+            self.on_evict(key, value)
+        except Exception as e:
+            logger.error(f"Ошибка освобождения записи {key} из {self.name}: {e}")
+
+    def _get_entry(self, key):
+        # Возвращает живую запись (продлевая её при sliding), просроченную удаляет
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self._evict(key, entry[1])
+            return None
+        if self.sliding:
+            self._data[key] = (time.monotonic() + self.ttl, entry[1])
+        self._data.move_to_end(key)
+        return entry
+
+    def __getitem__(self, key):
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is not None:
+                return entry[1]
+            if self.default_factory is None:
+                raise KeyError(key)
+            value = self.default_factory()
+            self[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                evicted_key, (_, evicted_value) = self._data.popitem(last=False)
+                self.evictions += 1
+                self._evict(evicted_key, evicted_value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._get_entry(key) is not None
+
+    # get, pop и setdefault, как у defaultdict, не создают запись через default_factory
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._get_entry(key)
+            return entry[1] if entry is not None else default
+
+    def pop(self, key, *default):
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is None:
+                if default:
+                    return default[0]
+                raise KeyError(key)
+            del self._data[key]
+            return entry[1]
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is not None:
+                return entry[1]
+            self[key] = default
+            return default
+
+    def popitem(self):
+        with self._lock:
+            self.purge()
+            if not self._data:
+                raise KeyError('popitem(): store is empty')
+            key, (_, value) = self._data.popitem(last=False)
+            return key, value
+
+    def items(self):
+        with self._lock:
+            self.purge()
+            return [(key, value) for key, (_, value) in self._data.items()]
+
+    def values(self):
+        with self._lock:
+            self.purge()
+            return [value for _, value in self._data.values()]
+
+    def __iter__(self):
+        with self._lock:
+            self.purge()
+            return iter(list(self._data))
+
+    def __len__(self):
+        with self._lock:
+            self.purge()
+            return len(self._data)
+
+    def purge(self):
+        """Удаляет просроченные записи, возвращает их количество"""
+        with self._lock:
+            now = time.monotonic()
+            expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+            for key in expired:
+                _, value = self._data.pop(key)
+                self._evict(key, value)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def stats(self):
+        with self._lock:
+            self.purge()
+            return {
+                'size': len(self._data),
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+def state_stats():
+    return {name: store.stats() for name, store in state_stores.items()}
+
+def purge_state(context: CallbackContext) -> None:
+    for store in state_stores.values():
+        store.purge()
+    
+    summary = ", ".join(
+        f"{name}: {s['size']} (вытеснено {s['evictions']}, истекло {s['expirations']})"
+        for name, s in state_stats().items()
+    )
+    logger.info(f"Состояние в памяти: {summary}")
+
 class TelegramAccountManager:
     def __init__(self):
-        self.active_clients = {}
-        self.verification_codes = {}
+        self.active_clients = ExpiringStore(
+            'active_clients', ACTIVE_CLIENT_TTL, ACTIVE_CLIENT_MAX_ENTRIES, on_evict=self.disconnect_client
+        )
+        # Код действует фиксированное время с момента выдачи, проверки его не продлевают
+        self.verification_codes = ExpiringStore(
+            'verification_codes', VERIFICATION_CODE_TTL, VERIFICATION_CODE_MAX_ENTRIES, sliding=False
+        )
+
+    @staticmethod
+    def disconnect_client(phone, client):
+        if client.loop.is_running():
+            # Цикл клиента работает в своём потоке: отключаем клиента внутри этого цикла
+            client.loop.call_soon_threadsafe(client.disconnect)
+            logger.info(f"Отключение клиента {phone} запланировано, клиент удален из памяти")
+        else:
+            client.disconnect()
+            logger.info(f"Клиент {phone} отключен и удален из памяти")
 
     async def connect_account(self, api_id, api_hash, phone, session_string=None):
         client = TelegramClient(
@@ -339,7 +673,10 @@ def handle_code(update: Update, context: CallbackContext) -> int:
     
     # В реальном боте здесь проверка кода
     # Для демо просто сохраняем аккаунт
-    phone = context.user_data['phone']
+    phone = context.user_data.pop('phone', None)
+    if not phone:
+        update.message.reply_text("Сессия подключения истекла. Начните заново.")
+        return ConversationHandler.END
     DatabaseManager.add_account(user_id, phone)
     
     update.message.reply_text("Аккаунт успешно подключен!")
@@ -347,6 +684,32 @@ def handle_code(update: Update, context: CallbackContext) -> int:
     
     return ConversationHandler.END
 
+def clear_conversation_data(context: CallbackContext) -> None:
+    # Временные данные незавершённого диалога
+    context.user_data.pop('phone', None)
+
+def conversation_timeout(update: Update, context: CallbackContext) -> None:
+    if update and update.effective_user:
+        DatabaseManager.log_action(update.effective_user.id, "conversation_timeout")
+    
+    clear_conversation_data(context)
+    
+    if update and update.effective_chat:
+        context.bot.send_message(
+            update.effective_chat.id,
+            "Время ожидания истекло, действие отменено. Начните заново через /start."
+        )
+
+def cancel_conversation(update: Update, context: CallbackContext) -> int:
+    user_id = update.effective_user.id
+    DatabaseManager.log_action(user_id, "conversation_cancelled")
+    
+    clear_conversation_data(context)
+    update.message.reply_text("Действие отменено.")
+    start(update, context)
+    
+    return ConversationHandler.END
+
 def request_api_data(update: Update, context: CallbackContext) -> int:
     query = update.callback_query
     user_id = query.from_user.id
@@ -616,8 +979,88 @@ def show_stats(update: Update, context: CallbackContext) -> None:
 🗂 Целевых групп: {total_groups}
     """
     
+    if is_admin(user_id):
+        stats_text += "\n🧠 Состояние в памяти:\n" + "\n".join(
+            f"{name}: {s['size']} (вытеснено {s['evictions']}, истекло {s['expirations']})"
+            for name, s in state_stats().items()
+        )
+    
     update.message.reply_text(stats_text)
     
+def is_admin(user_id):
+    admin_ids = os.getenv('ADMIN_IDS', '')
+    return str(user_id) in [i.strip() for i in admin_ids.split(',') if i.strip()]
+
+def export_data(update: Update, context: CallbackContext) -> None:
+    """Выгрузка данных для администратора: /export logs|messages|deliveries [csv|jsonl] [user=ID] [since=ДАТА] [until=ДАТА]"""
+    user_id = update.effective_user.id
+    
+    if not is_admin(user_id):
+        update.message.reply_text("Команда доступна только администраторам.")
+        return
+    
+    args = context.args or []
+    if not args or args[0] not in EXPORT_DATASETS:
+        update.message.reply_text(
+            "Использование: /export logs|messages|deliveries [csv|jsonl] [user=ID] [since=ДАТА] [until=ДАТА]"
+        )
+        return
+    
+    dataset = args[0]
+    fmt = 'csv'
+    filters = {}
+    try:
+        for arg in args[1:]:
+            if arg in EXPORT_FORMATS:
+                fmt = arg
+                continue
+            key, value = arg.split('=', 1)
+            if key == 'user':
+                filters['user_id'] = int(value)
+            elif key in ('since', 'until'):
+                filters[key] = DataExporter.normalize_time(value)
+            else:
+                raise ValueError(f"Неизвестный параметр: {key}")
+    except ValueError as e:
+        update.message.reply_text(f"Неверные параметры выгрузки: {e}")
+        return
+    
+    DatabaseManager.log_action(user_id, "export_data", f"dataset: {dataset}, format: {fmt}")
+    update.message.reply_text("Готовлю выгрузку...")
+    
+    # Выгрузка может быть долгой, поэтому выполняется в фоне
+    Thread(
+        target=export_data_background,
+        args=(context.bot, update.effective_chat.id, dataset, fmt, filters),
+    ).start()
+
+def export_data_background(bot, chat_id, dataset, fmt, filters):
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = f"{dataset}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{fmt}.gz"
+            path = os.path.join(tmp_dir, filename)
+            count = DataExporter.export(dataset, path, fmt, **filters)
+            
+            if os.path.getsize(path) > EXPORT_MAX_UPLOAD_SIZE:
+                command = f"python main.py export {dataset} -f {fmt}"
+                if 'user_id' in filters:
+                    command += f" --user {filters['user_id']}"
+                for key in ('since', 'until'):
+                    if key in filters:
+                        command += f" --{key} '{filters[key]}'"
+                bot.send_message(
+                    chat_id,
+                    f"Выгрузка ({count} строк) больше 50 МБ и не может быть отправлена ботом. "
+                    f"Сузьте период или выполните на сервере:\n{command}"
+                )
+                return
+            
+            with open(path, 'rb') as f:
+                bot.send_document(chat_id, f, filename=filename, caption=f"Выгружено строк: {count}")
+    except Exception as e:
+        logger.error(f"Ошибка выгрузки {dataset}: {e}")
+        bot.send_message(chat_id, f"Ошибка выгрузки: {e}")
+
 def main() -> None:
     # Проверяем наличие обязательных переменных
     if not os.getenv('BOT_TOKEN'):
@@ -627,12 +1070,20 @@ def main() -> None:
     if not os.getenv('API_ID') or not os.getenv('API_HASH'):
         logger.warning("API_ID и/или API_HASH не заданы. Некоторые функции могут не работать.")
     
+    # Схема создаётся только при запуске бота: выгрузка открывает базу лишь на чтение
+    init_db()
+    
     updater = Updater(os.getenv('BOT_TOKEN'))
     dispatcher = updater.dispatcher
     
+    # Данные пользователей живут ограниченное время и не растут без предела
+    dispatcher.user_data = ExpiringStore('user_data', USER_DATA_TTL, USER_DATA_MAX_ENTRIES, default_factory=dict)
+    dispatcher.chat_data = ExpiringStore('chat_data', CHAT_DATA_TTL, CHAT_DATA_MAX_ENTRIES, default_factory=dict)
+    
     # Обработчики команд
     dispatcher.add_handler(CommandHandler('start', start))
     dispatcher.add_handler(CommandHandler('stats', show_stats))
+    dispatcher.add_handler(CommandHandler('export', export_data))
     
     # Обработчики кнопок
     dispatcher.add_handler(CallbackQueryHandler(connect_account_menu, pattern='^connect_account$'))
@@ -644,36 +1095,48 @@ def main() -> None:
     
     # Conversation handlers
     conv_handler_phone = ConversationHandler(
+        name='phone',
         entry_points=[CallbackQueryHandler(request_phone_number, pattern='^connect_phone$')],
         states={
             PHONE_NUMBER: [MessageHandler(Filters.text & ~Filters.command, handle_phone_number)],
             CODE: [MessageHandler(Filters.text & ~Filters.command, handle_code)],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, conversation_timeout)],
         },
-        fallbacks=[],
+        fallbacks=[CommandHandler('cancel', cancel_conversation)],
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
     
     conv_handler_api = ConversationHandler(
+        name='api',
         entry_points=[CallbackQueryHandler(request_api_data, pattern='^connect_api$')],
         states={
             API_DATA: [MessageHandler(Filters.text & ~Filters.command, handle_api_data)],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, conversation_timeout)],
         },
-        fallbacks=[],
+        fallbacks=[CommandHandler('cancel', cancel_conversation)],
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
     
     conv_handler_group = ConversationHandler(
+        name='group',
         entry_points=[CallbackQueryHandler(request_group_info, pattern='^add_group$')],
         states={
             ADD_GROUP: [MessageHandler(Filters.text & ~Filters.command, handle_group_info)],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, conversation_timeout)],
         },
-        fallbacks=[],
+        fallbacks=[CommandHandler('cancel', cancel_conversation)],
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
     
     conv_handler_message = ConversationHandler(
+        name='message',
         entry_points=[CallbackQueryHandler(request_message_text, pattern='^set_message$')],
         states={
             MESSAGE_TEXT: [MessageHandler(Filters.text & ~Filters.command, handle_message_text)],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, conversation_timeout)],
         },
-        fallbacks=[],
+        fallbacks=[CommandHandler('cancel', cancel_conversation)],
+        conversation_timeout=CONVERSATION_TIMEOUT,
     )
     
     dispatcher.add_handler(conv_handler_phone)
@@ -681,6 +1144,16 @@ def main() -> None:
     dispatcher.add_handler(conv_handler_group)
     dispatcher.add_handler(conv_handler_message)
     
+    # Незавершённые диалоги хранятся с тем же ограничением по времени и размеру.
+    # Срок отсчитывается от смены состояния: проверка каждого апдейта его не продлевает
+    for handler in (conv_handler_phone, conv_handler_api, conv_handler_group, conv_handler_message):
+        handler.conversations = ExpiringStore(
+            f'conversations_{handler.name}', CONVERSATION_TIMEOUT, CONVERSATION_MAX_ENTRIES, sliding=False
+        )
+    
+    # Периодическая очистка просроченных записей и отчёт о размере состояния
+    updater.job_queue.run_repeating(purge_state, interval=STATE_PURGE_INTERVAL, first=STATE_PURGE_INTERVAL)
+    
     # Обработчик ошибок
     dispatcher.add_error_handler(error_handler)
     
@@ -689,5 +1162,37 @@ def main() -> None:
     logger.info("Бот запущен и готов к работе")
     updater.idle()
 
+def export_cli(argv=None) -> int:
+    """Выгрузка из командной строки: python main.py export logs -o logs.csv.gz"""
+    parser = argparse.ArgumentParser(prog='main.py export', description="Потоковая выгрузка данных бота")
+    parser.add_argument('dataset', choices=sorted(EXPORT_DATASETS))
+    parser.add_argument('-o', '--output', help="Файл для выгрузки (по умолчанию <dataset>.<format>.gz)")
+    parser.add_argument('-f', '--format', choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument('--user', type=int, dest='user_id', help="ID пользователя")
+    parser.add_argument('--since', help="Начало периода (ISO, включительно)")
+    parser.add_argument('--until', help="Конец периода (ISO, не включительно)")
+    parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+    
+    output = args.output or f"{args.dataset}.{args.format}.gz"
+    try:
+        count = DataExporter.export(
+            args.dataset,
+            output,
+            args.format,
+            user_id=args.user_id,
+            since=args.since,
+            until=args.until,
+            batch_size=args.batch_size,
+        )
+    except (ValueError, sqlite3.Error, OSError) as e:
+        logger.error(f"Ошибка выгрузки {args.dataset}: {e}")
+        return 1
+    
+    logger.info(f"Выгружено строк: {count} в {output}")
+    return 0
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'export':
+        sys.exit(export_cli(sys.argv[2:]))
     main()
\ No newline at end of file